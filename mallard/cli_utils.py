@@ -3,10 +3,9 @@ Utilities for interacting with CLI applications.
 """
 
 
-import subprocess
+import shutil
 from functools import cache
 from pathlib import Path
-from subprocess import CalledProcessError
 
 from loguru import logger
 
@@ -23,21 +22,11 @@ def find_exe(tool_name: str) -> Path:
         The path to the tool.
 
     """
-    which_output = ""
-    try:
-        which_result = subprocess.run(
-            ["/usr/bin/which", tool_name], check=True, capture_output=True
-        )
-        which_output = which_result.stdout.decode("utf8")
-    except CalledProcessError as err:
-        if err.returncode != 1:  # pragma: no cover
-            # If it returns 1, it's probably because the executable does not
-            # exist. Otherwise, something weird happened.
-            raise err
-        pass
-    if not which_output:
+    # Search the PATH in-process instead of spawning `which`.
+    exe_path = shutil.which(tool_name)
+    if exe_path is None:
         raise OSError(f"Could not find '{tool_name}'. Is it installed?")
 
-    tool_path = Path(which_output.rstrip("\n"))
+    tool_path = Path(exe_path)
     logger.debug("Using {} executable: {}", tool_name, tool_path)
     return tool_path
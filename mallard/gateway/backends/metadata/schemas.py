@@ -29,6 +29,11 @@ class GeoPoint(ApiModel):
     latitude_deg: Optional[float] = None
     longitude_deg: Optional[float] = None
 
+    class Config:
+        # Points are immutable, so they can be shared instead of copied when
+        # used as a field of another model.
+        copy_on_model_validation = "none"
+
     @validator("latitude_deg")
     def lat_in_range(
         cls, latitude: Optional[float]
@@ -296,55 +301,41 @@ class ImageQuery(ApiModel):
         min_value: Optional[RangeType] = None
         max_value: Optional[RangeType] = None
 
-        @validator("max_value")
-        def min_value_less_than_max(
-            cls, max_value: RangeType, values: Dict[str, RangeType]
-        ) -> RangeType:  # pragma: no cover
+        class Config:
+            # Ranges are immutable, so they can be shared instead of copied
+            # when used as a field of another model.
+            copy_on_model_validation = "none"
+
+        @root_validator()
+        def check_range(
+            cls, values: Dict[str, RangeType]
+        ) -> Dict[str, RangeType]:  # pragma: no cover
             """
-            Checks that the low end of the range is not larger than the high
-            end.
+            Checks that at least one side of the range is specified, and that
+            the low end of the range is not larger than the high end.
 
             Args:
-                max_value: The maximum range value.
                 values: The previously-validated fields.
 
             Returns:
-                The validated maximum range value.
+                The validated values.
 
             """
             min_value = values.get("min_value")
+            max_value = values.get("max_value")
+
+            assert (
+                min_value is not None or max_value is not None
+            ), "At least one side of the range must be specified."
             if min_value is None or max_value is None:
-                # We did not specify both sides of the range, so this check
-                # is irrelevant.
-                return max_value
+                # We did not specify both sides of the range, so there is
+                # nothing to compare.
+                return values
 
             assert (
                 min_value <= max_value
             ), "Range min_value cannot be larger than max_value."
 
-            return max_value
-
-        @root_validator()
-        def at_least_one_side_specified(
-            cls, values: Dict[str, RangeType]
-        ) -> RangeType:  # pragma: no cover
-            """
-            Checks that at least one side of the range is specified.
-
-            Args:
-                values: The previously-validated fields.
-
-            Returns:
-                The validated value.
-
-            """
-            any_specified = False
-            for v in values.values():
-                any_specified = any_specified or (v is not None)
-
-            assert (
-                any_specified
-            ), "At least one side of the range must be specified."
             return values
 
     class BoundingBox(ApiModel):
@@ -359,6 +350,11 @@ class ImageQuery(ApiModel):
         south_west: GeoPoint
         north_east: GeoPoint
 
+        class Config:
+            # Bounding boxes are immutable, so they can be shared instead of
+            # copied when used as a field of another model.
+            copy_on_model_validation = "none"
+
     platform_type: Optional[PlatformType] = None
     name: Optional[str] = None
     notes: Optional[str] = None
@@ -540,8 +540,10 @@ class SqlArtifactMetadataStore(
 
         for result in query_results.scalars():
             object_type = self.__object_type(result)
-            yield TypedObjectRef(
-                id=ObjectRef(bucket=result.bucket, name=result.key),
+            # These values come straight from the database, so we can skip
+            # validation.
+            yield TypedObjectRef.construct(
+                id=ObjectRef.construct(bucket=result.bucket, name=result.key),
                 type=object_type,
             )
 
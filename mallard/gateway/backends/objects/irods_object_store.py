@@ -109,9 +109,15 @@ class IrodsObjectStore(IrodsStore, ObjectStore):
             yield data_object.name
 
     async def create_object(
-        self, object_id: ObjectRef, *, data: Union[bytes, BytesIO, UploadFile]
+        self,
+        object_id: ObjectRef,
+        *,
+        data: Union[bytes, BytesIO, UploadFile],
+        skip_bucket_check: bool = False,
     ) -> None:
-        if not await self.bucket_exists(object_id.bucket):
+        if not skip_bucket_check and not await self.bucket_exists(
+            object_id.bucket
+        ):
             # Invalid bucket.
             raise KeyError(f"Bucket '{object_id.bucket}' does not exist.")
 
@@ -4,7 +4,7 @@ Data models for object storage.
 
 
 import enum
-import uuid
+import secrets
 from datetime import date
 
 from pydantic import BaseModel
@@ -79,4 +79,4 @@ def unique_name() -> str:
         The generated name.
 
     """
-    return f"{date.today().isoformat()}-{uuid.uuid4().hex}"
+    return f"{date.today().isoformat()}-{secrets.token_hex(16)}"
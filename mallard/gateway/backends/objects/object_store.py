@@ -102,7 +102,8 @@ class ObjectStore(Injectable):
         self,
         object_id: ObjectRef,
         *,
-        data: bytes | BytesIO | UploadFile | AsyncIterable[bytes]
+        data: bytes | BytesIO | UploadFile | AsyncIterable[bytes],
+        skip_bucket_check: bool = False
     ) -> None:
         """
         Creates a new object.
@@ -110,6 +111,9 @@ class ObjectStore(Injectable):
         Args:
             object_id: The identifier of the object being created.
             data: The raw data contained in the object.
+            skip_bucket_check: If true, it will assume that the bucket exists
+                instead of checking first. Set this when the caller has
+                already verified the bucket.
 
         Notes:
             Depending on the exact semantics of the backend, this might
@@ -418,8 +418,11 @@ class S3ObjectStore(ObjectStore):
         object_id: ObjectRef,
         *,
         data: bytes | BytesIO | UploadFile | AsyncIterable[bytes],
+        skip_bucket_check: bool = False,
     ) -> None:
-        if not await self.bucket_exists(object_id.bucket):
+        if not skip_bucket_check and not await self.bucket_exists(
+            object_id.bucket
+        ):
             raise KeyError(f"Bucket '{object_id.bucket}' does not exist.")
         logger.info("Requesting creation of new object {}.", object_id)
 
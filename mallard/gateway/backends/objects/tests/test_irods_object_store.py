@@ -452,6 +452,34 @@ class TestIrodsObjectStore:
         with pytest.raises(KeyError, match="does not exist"):
             await config.store.create_object(faker.object_ref(), data=b"")
 
+    @pytest.mark.asyncio
+    async def test_create_object_skip_bucket_check(
+        self, config: ConfigForTests, faker: Faker
+    ) -> None:
+        """
+        Tests that `create_object` does not check the bucket when the caller
+        has already verified it.
+
+        Args:
+            config: The configuration to use for testing.
+            faker: The fixture to use for generating fake data.
+
+        """
+        # Arrange.
+        # Make it look like the object does not exist yet.
+        config.mock_session.data_objects.get.side_effect = (
+            DataObjectDoesNotExist
+        )
+
+        # Act.
+        await config.store.create_object(
+            faker.object_ref(), data=b"", skip_bucket_check=True
+        )
+
+        # Assert.
+        config.mock_session.collections.exists.assert_not_called()
+        config.mock_session.data_objects.create.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_object_exists(
         self, config: ConfigForTests, faker: Faker
@@ -506,6 +506,31 @@ class TestS3ObjectStore:
         with pytest.raises(KeyError, match="does not exist"):
             await config.store.create_object(faker.object_ref(), data=b"")
 
+    @pytest.mark.asyncio
+    async def test_create_object_skip_bucket_check(
+        self, config: ConfigForTests, faker: Faker
+    ) -> None:
+        """
+        Tests that creating an object does not check the bucket when the
+        caller has already verified it.
+
+        Args:
+            config: The configuration to use for testing.
+            faker: The fixture to use for generating fake data.
+
+        """
+        # Arrange.
+        object_id = faker.object_ref()
+
+        # Act.
+        await config.store.create_object(
+            object_id, data=b"", skip_bucket_check=True
+        )
+
+        # Assert.
+        config.mock_client.head_bucket.assert_not_called()
+        config.mock_client.put_object.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_object_exists_true(
         self, config: ConfigForTests, faker: Faker
@@ -651,7 +676,7 @@ class TestS3ObjectStore:
 
         # Make it look like we got valid data.
         mock_body = mocker.create_autospec(StreamingBody, instace=True)
-        object_chunk = faker.binary()
+        object_chunk = faker.random.randbytes(2**20)
         mock_body.read.side_effect = [object_chunk, b""]
         config.mock_client.get_object.return_value = dict(Body=mock_body)
 
@@ -135,19 +135,26 @@ def flatten_dict(
 
     """
 
-    def _flatten_dict(input_dict: dict, prefix: str) -> dict:
-        flat = {}
-        for param, value in input_dict.items():
+    flat = {}
+    # Walk the nested dictionaries iteratively. Each stack entry is the
+    # prefix for a dictionary and an iterator over its remaining items,
+    # which keeps the output in the same order as the input.
+    stack = [("", iter(nested.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for param, value in items:
             # Use the prefixed key.
             prefixed_key = combine_keys(prefix, param)
 
             if type(value) is dict:
-                value = _flatten_dict(value, prefixed_key)
-                flat.update(value)
+                # Finish this dictionary before continuing with the parent.
+                stack.append((prefixed_key, iter(value.items())))
+                break
 
-            else:
-                flat[prefixed_key] = value
+            flat[prefixed_key] = value
 
-        return flat
+        else:
+            # We've exhausted this dictionary.
+            stack.pop()
 
-    return _flatten_dict(nested, "")
+    return flat
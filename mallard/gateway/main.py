@@ -5,6 +5,7 @@ Main entry point for API gateway.
 
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 from ..config import config
@@ -27,7 +28,11 @@ if not config["security"]["enable_auth"].get(bool):
     dependencies.append(Depends(_dummy_token))
 else:
     dependencies.append(Depends(flexible_token))
-app = FastAPI(debug=True, dependencies=dependencies)
+app = FastAPI(
+    debug=True,
+    dependencies=dependencies,
+    default_response_class=ORJSONResponse,
+)
 
 app.include_router(images.router)
 app.include_router(videos.router)
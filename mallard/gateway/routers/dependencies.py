@@ -21,6 +21,12 @@ _VIDEO_BUCKET = "mallard-videos"
 Name of the bucket to use for videos.
 """
 
+_g_known_buckets: set[str] = set()
+"""
+Buckets that we have already verified exist, so we don't have to check the
+object store again for every upload.
+"""
+
 
 def user_timezone(tz: Annotated[float, Query(..., ge=-24, le=24)]) -> timezone:
     """
@@ -48,12 +54,16 @@ async def _use_bucket(object_store: ObjectStore, *, bucket_name: str) -> str:
         doesn't exist.
 
     """
+    if bucket_name in _g_known_buckets:
+        return bucket_name
+
     if not await object_store.bucket_exists(bucket_name):
         logger.debug("Creating a new bucket: {}", bucket_name)
         # We specify exists_ok because there is a possible race-condition if
         # it is servicing multiple requests concurrently.
         await object_store.create_bucket(bucket_name, exists_ok=True)
 
+    _g_known_buckets.add(bucket_name)
     return bucket_name
 
 
@@ -177,49 +177,72 @@ async def create_uav_image(
         A `CreateResponse` object for this image.
 
     """
-    # We need the raw image data to create the thumbnail.
+    # We need the raw image data to create the thumbnail. Since we have it in
+    # memory anyway, we upload it from there instead of reading the file
+    # again.
     image_bytes = await image_data.read()
-    # Reset so we can read it again when storing it.
-    await image_data.seek(0)
 
-    # Create the image in the object store.
+    # Choose a unique name for the image.
     object_id = ObjectRef(bucket=bucket, name=unique_name())
     logger.info(
         "Creating a new image {} in bucket {}.",
         object_id.name,
         object_id.bucket,
     )
-    object_task = asyncio.create_task(
-        object_store.create_object(object_id, data=image_data)
-    )
-
-    # Create the corresponding metadata.
-    metadata_task = asyncio.create_task(
-        metadata_store.add(object_id=object_id, metadata=metadata)
-    )
-
-    # Create and save the thumbnail.
     thumbnail_object_id = derived_id(object_id, "thumbnail")
 
     async def _create_and_save_thumbnail() -> None:
         thumbnail = await _create_thumbnail(image_bytes)
-        await object_store.create_object(thumbnail_object_id, data=thumbnail)
-
-    thumbnail_task = asyncio.create_task(_create_and_save_thumbnail())
+        await object_store.create_object(
+            thumbnail_object_id, data=thumbnail, skip_bucket_check=True
+        )
 
     try:
-        await asyncio.gather(object_task, metadata_task, thumbnail_task)
-    except MetadataOperationError as error:
+        async with asyncio.TaskGroup() as tasks:
+            # Create the image in the object store. use_bucket_images has
+            # already made sure that the bucket exists.
+            tasks.create_task(
+                object_store.create_object(
+                    object_id, data=image_bytes, skip_bucket_check=True
+                )
+            )
+            # Create the corresponding metadata.
+            tasks.create_task(
+                metadata_store.add(object_id=object_id, metadata=metadata)
+            )
+            # Create and save the thumbnail.
+            tasks.create_task(_create_and_save_thumbnail())
+
+    except ExceptionGroup as ex_group:
         # If one operation fails, it would be best to try and roll back the
-        # other.
-        logger.info("Rolling back object creation {} upon error.", object_id)
-        await object_store.delete_object(object_id)
-        await object_store.delete_object(thumbnail_object_id)
-        raise error
-    except ObjectOperationError as error:
-        logger.info("Rolling back metadata add for {} upon error.", object_id)
-        await metadata_store.delete(object_id)
-        raise error
+        # other. Some of the operations might have been cancelled before they
+        # finished, so there might not be anything to delete.
+        metadata_errors, _ = ex_group.split(MetadataOperationError)
+        if metadata_errors is not None:
+            logger.info(
+                "Rolling back object creation {} upon error.", object_id
+            )
+            await ignore_errors(object_store.delete_object(object_id))
+            await ignore_errors(
+                object_store.delete_object(thumbnail_object_id)
+            )
+            raise metadata_errors.exceptions[0]
+
+        object_errors, _ = ex_group.split(ObjectOperationError)
+        if object_errors is not None:
+            logger.info(
+                "Rolling back metadata add for {} upon error.", object_id
+            )
+            await ignore_errors(metadata_store.delete(object_id))
+            raise object_errors.exceptions[0]
+
+        # Something else failed, such as thumbnail creation, so both writes
+        # might have succeeded.
+        logger.info("Rolling back creation of {} upon error.", object_id)
+        await ignore_errors(object_store.delete_object(object_id))
+        await ignore_errors(object_store.delete_object(thumbnail_object_id))
+        await ignore_errors(metadata_store.delete(object_id))
+        raise ex_group.exceptions[0]
 
     return CreateResponse(image_id=object_id)
 
@@ -3,6 +3,7 @@ Helper functions for extracting metadata from images.
 """
 
 
+import asyncio
 import enum
 import imghdr
 from datetime import datetime, timezone, tzinfo
@@ -10,6 +11,8 @@ from functools import cached_property
 from typing import BinaryIO, Optional, TypeVar
 
 import exifread
+from exifread.classes import IfdTag
+from exifread.utils import Ratio
 from fastapi import UploadFile
 from loguru import logger
 
@@ -28,6 +31,41 @@ class InvalidImageError(Exception):
     """
 
 
+_EMPTY_LOCATION = GeoPoint()
+"""
+Location to use for images with no usable GPS data. `GeoPoint` is immutable,
+so this can be shared.
+"""
+
+
+def _parse_exif_datetime(date_time: str) -> datetime:
+    """
+    Parses an EXIF timestamp, which has the fixed-width format
+    "YYYY:MM:DD HH:MM:SS". This is considerably faster than `strptime`.
+
+    Args:
+        date_time: The timestamp to parse.
+
+    Returns:
+        The parsed timestamp, with no timezone.
+
+    Raises:
+        `ValueError` if the timestamp is not in the expected format.
+
+    """
+    if len(date_time) != 19 or date_time[4:17:3] != ":: ::":
+        raise ValueError(f"Invalid EXIF timestamp '{date_time}'.")
+
+    return datetime(
+        int(date_time[0:4]),
+        int(date_time[5:7]),
+        int(date_time[8:10]),
+        int(date_time[11:13]),
+        int(date_time[14:16]),
+        int(date_time[17:19]),
+    )
+
+
 class ExifReader:
     """
     Extracts EXIF data from images.
@@ -44,6 +82,16 @@ class ExifReader:
         EAST = "E"
         WEST = "W"
 
+    _DIRECTION_SIGNS = {
+        LatLonDirection.NORTH: 1.0,
+        LatLonDirection.SOUTH: -1.0,
+        LatLonDirection.EAST: 1.0,
+        LatLonDirection.WEST: -1.0,
+    }
+    """
+    Sign of the decimal angle for each direction.
+    """
+
     @enum.unique
     class ExifTag(enum.Enum):
         """
@@ -58,6 +106,20 @@ class ExifReader:
         GPS_LATITUDE_REF = "GPS GPSLatitudeRef"
         GPS_LONGITUDE_REF = "GPS GPSLongitudeRef"
 
+    _CAMERA_TAGS = (ExifTag.IMAGE_MAKE.value, ExifTag.IMAGE_MODEL.value)
+    """
+    Names of the tags that describe the camera.
+    """
+    _LOCATION_TAGS = (
+        ExifTag.GPS_LATITUDE.value,
+        ExifTag.GPS_LONGITUDE.value,
+        ExifTag.GPS_LATITUDE_REF.value,
+        ExifTag.GPS_LONGITUDE_REF.value,
+    )
+    """
+    Names of the tags that describe the location.
+    """
+
     def __init__(self, image_file: UploadFile, *, local_tz: tzinfo):
         """
         Args:
@@ -76,9 +138,9 @@ class ExifReader:
     @classmethod
     def __dms_to_decimal(
         cls,
-        degrees: float,
-        minutes: float,
-        seconds: float,
+        degrees: Ratio,
+        minutes: Ratio,
+        seconds: Ratio,
         *,
         direction: LatLonDirection,
     ) -> float:
@@ -97,11 +159,11 @@ class ExifReader:
             The same angle in decimal degrees.
 
         """
-        angle = degrees + minutes / 60 + seconds / (60**2)
-        if direction in {cls.LatLonDirection.WEST, cls.LatLonDirection.SOUTH}:
-            angle *= -1
-
-        return angle
+        return cls._DIRECTION_SIGNS[direction] * (
+            degrees.num / degrees.den
+            + minutes.num / (minutes.den * 60)
+            + seconds.num / (seconds.den * 60**2)
+        )
 
     @cached_property
     def capture_datetime(self) -> datetime:
@@ -122,9 +184,7 @@ class ExifReader:
 
         # Parse the time.
         try:
-            capture_time = datetime.strptime(
-                capture_time_tag.values, "%Y:%m:%d %H:%M:%S"
-            )
+            capture_time = _parse_exif_datetime(capture_time_tag.values)
         except ValueError:
             logger.error(
                 "Image {} has capture time {}, but format is not correct.",
@@ -146,8 +206,7 @@ class ExifReader:
             extracted, it will return None.
 
         """
-        make_tag = self.__exif.get(self.ExifTag.IMAGE_MAKE.value)
-        model_tag = self.__exif.get(self.ExifTag.IMAGE_MODEL.value)
+        make_tag, model_tag = map(self.__exif.get, self._CAMERA_TAGS)
         if make_tag is None or model_tag is None:
             logger.warning(
                 "Image {} has no camera make/model tags.", self.__name
@@ -165,13 +224,12 @@ class ExifReader:
 
         """
         # Parse the GPS data.
-        lat = self.__exif.get(self.ExifTag.GPS_LATITUDE.value)
-        lon = self.__exif.get(self.ExifTag.GPS_LONGITUDE.value)
-        lat_direction = self.__exif.get(self.ExifTag.GPS_LATITUDE_REF.value)
-        lon_direction = self.__exif.get(self.ExifTag.GPS_LONGITUDE_REF.value)
-        if None in {lat, lon, lat_direction, lon_direction}:
+        lat, lon, lat_direction, lon_direction = map(
+            self.__exif.get, self._LOCATION_TAGS
+        )
+        if None in (lat, lon, lat_direction, lon_direction):
             logger.warning("Image {} is missing GPS tags.", self.__name)
-            return GeoPoint()
+            return _EMPTY_LOCATION
 
         try:
             lat_direction = self.LatLonDirection(lat_direction.values)
@@ -183,16 +241,14 @@ class ExifReader:
                 lat_direction,
                 lon_direction,
             )
-            return GeoPoint()
+            return _EMPTY_LOCATION
 
         # Convert to decimal degrees.
-        lat_floats = [c.decimal() for c in lat.values]
         lat_decimal = self.__dms_to_decimal(
-            *lat_floats, direction=lat_direction
+            *lat.values, direction=lat_direction
         )
-        lon_floats = [c.decimal() for c in lon.values]
         lon_decimal = self.__dms_to_decimal(
-            *lon_floats, direction=lon_direction
+            *lon.values, direction=lon_direction
         )
 
         return GeoPoint(latitude_deg=lat_decimal, longitude_deg=lon_decimal)
@@ -276,21 +332,32 @@ async def fill_metadata(
         A completed copy of the image metadata.
 
     """
-    # Fill in missing fields.
-    exif = ExifReader(image, local_tz=local_tz)
+    location = metadata.location
+    missing_location = (
+        location.latitude_deg is None or location.longitude_deg is None
+    )
 
-    # Reset the image file after reading the EXIF data.
-    await image.seek(0)
+    # Only read the EXIF data if there is something we need from it.
+    exif_fields = {}
+    if missing_location or None in (metadata.capture_date, metadata.camera):
+        # exifread does blocking reads on the file, so keep it off the event
+        # loop.
+        exif = await asyncio.to_thread(ExifReader, image, local_tz=local_tz)
 
-    location = metadata.location
-    if location.latitude_deg is None or location.longitude_deg is None:
-        location = exif.location
+        # Reset the image file after reading the EXIF data.
+        await image.seek(0)
+
+        # Only extract the fields that we actually need.
+        if metadata.capture_date is None:
+            exif_fields["capture_date"] = exif.capture_datetime.date()
+        if metadata.camera is None:
+            exif_fields["camera"] = exif.camera
+        if missing_location:
+            exif_fields["location"] = exif.location
 
     return artifact_fill_metadata(
         metadata,
         artifact=image,
-        capture_date=exif.capture_datetime.date(),
-        camera=exif.camera,
-        location=location,
         format=await _check_format(metadata, image=image),
+        **exif_fields,
     )
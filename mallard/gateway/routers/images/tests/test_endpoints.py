@@ -32,14 +32,14 @@ class CreateUavParams:
     Attributes:
         mock_file: The mocked `UploadFile` to use.
         mock_metadata: The mocked `UavImageMetadata` structure.
-        mock_uuid: The mocked `uuid.uuid4` function.
+        mock_token_hex: The mocked `secrets.token_hex` function.
         bucket_id: The ID of the bucket to use for testing.
 
     """
 
     mock_file: UploadFile
     mock_metadata: UavImageMetadata
-    mock_uuid: mock.Mock
+    mock_token_hex: mock.Mock
     bucket_id: str
 
 
@@ -64,9 +64,9 @@ def create_uav_params(
     # Create fake metadata.
     mock_metadata = mocker.create_autospec(UavImageMetadata, instance=True)
 
-    # Make the UUID deterministic.
-    mock_uuid = mocker.patch("uuid.uuid4")
-    mock_uuid.return_value.hex = faker.uuid4()
+    # Make the unique name deterministic.
+    mock_token_hex = mocker.patch("secrets.token_hex")
+    mock_token_hex.return_value = faker.hexify("^" * 32)
 
     # Create a fake bucket.
     bucket = faker.pystr()
@@ -74,7 +74,7 @@ def create_uav_params(
     return CreateUavParams(
         mock_file=mock_file,
         mock_metadata=mock_metadata,
-        mock_uuid=mock_uuid,
+        mock_token_hex=mock_token_hex,
         bucket_id=bucket,
     )
 
@@ -118,13 +118,16 @@ async def test_create_uav_image(
     got_image_id = response.image_id
     assert got_image_id.bucket == create_uav_params.bucket_id
     assert got_image_id.name.endswith(
-        create_uav_params.mock_uuid.return_value.hex
+        create_uav_params.mock_token_hex.return_value
     )
 
     # It should have updated the databases.
     assert config.mock_object_store.create_object.call_count == 2
+    # It should have uploaded the image data that it already read.
     config.mock_object_store.create_object.assert_any_call(
-        got_image_id, data=create_uav_params.mock_file
+        got_image_id,
+        data=create_uav_params.mock_file.file.getvalue(),
+        skip_bucket_check=True,
     )
     config.mock_metadata_store.add.assert_called_once_with(
         object_id=got_image_id, metadata=create_uav_params.mock_metadata
@@ -186,6 +189,46 @@ async def test_create_uav_image_write_failure(
         assert config.mock_object_store.delete_object.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_create_uav_image_thumbnail_failure(
+    config: ConfigForTests,
+    create_uav_params: CreateUavParams,
+    mocker: MockFixture,
+) -> None:
+    """
+    Tests that `create_uav_image` handles it when creating the thumbnail
+    fails.
+
+    Args:
+        config: The configuration to use for testing.
+        create_uav_params: Common parameters for testing this endpoint.
+        mocker: The fixture to use for mocking.
+
+    """
+    # Arrange.
+    # Make it look like the thumbnail creation failed.
+    mocker.patch(
+        endpoints.__name__ + "._create_thumbnail",
+        side_effect=HTTPException(status_code=415),
+    )
+
+    # Act and assert.
+    # It should raise the original error, not an `ExceptionGroup`.
+    with pytest.raises(HTTPException):
+        await endpoints.create_uav_image(
+            metadata=create_uav_params.mock_metadata,
+            image_data=create_uav_params.mock_file,
+            object_store=config.mock_object_store,
+            metadata_store=config.mock_metadata_store,
+            bucket=create_uav_params.bucket_id,
+        )
+
+    # Assert.
+    # It should have rolled back both the object and the metadata.
+    assert config.mock_object_store.delete_object.call_count == 2
+    config.mock_metadata_store.delete.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_delete_images(config: ConfigForTests, faker: Faker) -> None:
     """
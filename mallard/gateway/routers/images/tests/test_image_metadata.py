@@ -171,8 +171,13 @@ class TestExifReader:
         mock_datetime_class.now.assert_called_once_with(timezone.utc)
         assert got_date_time == mock_datetime_class.now.return_value
 
+    @pytest.mark.parametrize(
+        "timestamp",
+        ("invalid", "2021-01-19 12:34:56", "2021:13:19 12:34:56"),
+        ids=("garbage", "wrong_separators", "out_of_range"),
+    )
     def test_capture_datetime_invalid_format(
-        self, config: ConfigForTests, mocker: MockFixture
+        self, config: ConfigForTests, mocker: MockFixture, timestamp: str
     ) -> None:
         """
         Tests that the `capture_datetime` property handles
@@ -181,6 +186,7 @@ class TestExifReader:
         Args:
             config: The configuration to use for testing.
             mocker: The fixture to use for mocking.
+            timestamp: The invalid timestamp to use.
 
         """
         # Arrange.
@@ -188,11 +194,11 @@ class TestExifReader:
         mock_datetime_class = mocker.patch(
             image_metadata.__name__ + ".datetime"
         )
-        # However, make sure that the strptime function still works.
-        mock_datetime_class.strptime.side_effect = datetime.strptime
+        # However, make sure that the constructor still works.
+        mock_datetime_class.side_effect = datetime
 
         # Make it look like the timestamp is invalid.
-        config.exif_tags[ExifTag.IMAGE_DATE_TIME.value].values = "invalid"
+        config.exif_tags[ExifTag.IMAGE_DATE_TIME.value].values = timestamp
 
         # Recreate the reader with the new EXIF tags.
         config.mock_process_file.return_value = config.exif_tags
@@ -501,6 +507,91 @@ async def test_fill_metadata(
         )
 
 
+@pytest.mark.asyncio
+async def test_fill_metadata_no_exif_needed(
+    fill_meta_config: FillMetadataConfig, local_tz: timezone
+) -> None:
+    """
+    Tests that `fill_metadata` doesn't bother reading EXIF data when all the
+    fields that could come from it are already specified.
+
+    Args:
+        fill_meta_config: The configuration to use for testing.
+        local_tz: The local timezone to use.
+
+    """
+    # Arrange.
+    metadata = UavImageMetadata(
+        capture_date=date(2021, 1, 19),
+        camera="camera",
+        location=GeoPoint(latitude_deg=32, longitude_deg=-114),
+    )
+
+    # Act.
+    got_metadata = await image_metadata.fill_metadata(
+        metadata, image=fill_meta_config.mock_upload_file, local_tz=local_tz
+    )
+
+    # Assert.
+    # It should not have read the EXIF data.
+    fill_meta_config.mock_reader_class.assert_not_called()
+
+    # It should have kept the user-provided values.
+    assert got_metadata.capture_date == metadata.capture_date
+    assert got_metadata.camera == metadata.camera
+    assert got_metadata.location == metadata.location
+    # It should still have inferred the other fields.
+    assert got_metadata.name == fill_meta_config.mock_upload_file.filename
+    assert got_metadata.format == fill_meta_config.image_format
+
+
+@pytest.mark.asyncio
+async def test_fill_metadata_partial_exif(
+    fill_meta_config: FillMetadataConfig,
+    local_tz: timezone,
+    mocker: MockFixture,
+) -> None:
+    """
+    Tests that `fill_metadata` only extracts the EXIF fields that are
+    actually missing.
+
+    Args:
+        fill_meta_config: The configuration to use for testing.
+        local_tz: The local timezone to use.
+        mocker: The fixture to use for mocking.
+
+    """
+    # Arrange.
+    # Track which properties are accessed.
+    mock_reader = fill_meta_config.mock_reader_class.return_value
+    mock_capture_datetime = mocker.PropertyMock(
+        return_value=mock_reader.capture_datetime
+    )
+    mock_location = mocker.PropertyMock(return_value=mock_reader.location)
+    type(mock_reader).capture_datetime = mock_capture_datetime
+    type(mock_reader).location = mock_location
+
+    # Only the camera is missing.
+    metadata = UavImageMetadata(
+        capture_date=date(2021, 1, 19),
+        location=GeoPoint(latitude_deg=32, longitude_deg=-114),
+    )
+
+    # Act.
+    got_metadata = await image_metadata.fill_metadata(
+        metadata, image=fill_meta_config.mock_upload_file, local_tz=local_tz
+    )
+
+    # Assert.
+    # It should have only extracted the camera.
+    mock_capture_datetime.assert_not_called()
+    mock_location.assert_not_called()
+    assert got_metadata.camera == mock_reader.camera
+
+    assert got_metadata.capture_date == metadata.capture_date
+    assert got_metadata.location == metadata.location
+
+
 @pytest.mark.asyncio
 async def test_fill_metadata_naughty_jpeg(
     local_tz: timezone, faker: Faker
@@ -517,7 +608,7 @@ async def test_fill_metadata_naughty_jpeg(
     # Arrange.
     # Create some fake JPEG-looking data.
     jpeg_header = b"\xff\xd8\xff"
-    jpeg_contents = jpeg_header + faker.binary()
+    jpeg_contents = jpeg_header + faker.random.randbytes(2**20)
     fake_jpeg = faker.upload_file(
         category="image",
         contents=jpeg_contents,
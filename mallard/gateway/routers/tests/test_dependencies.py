@@ -41,6 +41,9 @@ async def test_use_bucket(
 
     """
     # Arrange.
+    # Start with no buckets that are known to exist.
+    mocker.patch.object(dependencies, "_g_known_buckets", set())
+
     # Make it produce a consistent date.
     mock_date_class = mocker.patch(dependencies.__name__ + ".date")
     fake_date = faker.date()
@@ -71,6 +74,46 @@ async def test_use_bucket(
         assert got_bucket.endswith("videos")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "use_bucket",
+    (dependencies.use_bucket_images, dependencies.use_bucket_videos),
+    ids=("images", "videos"),
+)
+async def test_use_bucket_known(
+    config: ConfigForTests,
+    mocker: MockFixture,
+    use_bucket: Callable[[ObjectStore], Coroutine[str]],
+) -> None:
+    """
+    Tests that the `use_bucket` dependency function only checks the object
+    store the first time it is used.
+
+    Args:
+        config: The configuration to use for testing.
+        mocker: The fixture to use for mocking.
+        use_bucket: The specific variation of the use_bucket function to test.
+
+    """
+    # Arrange.
+    mocker.patch.object(dependencies, "_g_known_buckets", set())
+    config.mock_object_store.bucket_exists.return_value = False
+
+    # Act.
+    first_bucket = await use_bucket(config.mock_object_store)
+    second_bucket = await use_bucket(config.mock_object_store)
+
+    # Assert.
+    assert first_bucket == second_bucket
+    # It should only have checked the bucket once.
+    config.mock_object_store.bucket_exists.assert_called_once_with(
+        first_bucket
+    )
+    config.mock_object_store.create_bucket.assert_called_once_with(
+        first_bucket, exists_ok=True
+    )
+
+
 def test_user_timezone(faker: Faker) -> None:
     """
     Tests that the `user_timezone` dependency function works.
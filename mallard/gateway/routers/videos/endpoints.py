@@ -153,7 +153,10 @@ async def create_uav_video(
     logger.info(
         "Creating a new video {} in bucket {}.", object_id.name, bucket
     )
-    await object_store.create_object(object_id, data=video_data)
+    # use_bucket_videos has already made sure that the bucket exists.
+    await object_store.create_object(
+        object_id, data=video_data, skip_bucket_check=True
+    )
 
     # Infer the metadata and save it.
     try:
@@ -180,7 +183,9 @@ async def create_uav_video(
         preview = create_preview(
             object_id, chunk_size=ObjectStore.UPLOAD_CHUNK_SIZE
         )
-        await object_store.create_object(preview_object_id, data=preview)
+        await object_store.create_object(
+            preview_object_id, data=preview, skip_bucket_check=True
+        )
         logger.debug("Finished video preview background task.")
 
     async def _create_streamable() -> None:
@@ -188,7 +193,9 @@ async def create_uav_video(
         streamable = create_streamable(
             object_id, chunk_size=ObjectStore.UPLOAD_CHUNK_SIZE
         )
-        await object_store.create_object(streamable_object_id, data=streamable)
+        await object_store.create_object(
+            streamable_object_id, data=streamable, skip_bucket_check=True
+        )
         logger.debug("Finished video streamable background task.")
 
     background_tasks.add_task(_create_preview)
@@ -198,7 +205,9 @@ async def create_uav_video(
     thumbnail = create_thumbnail(
         object_id, chunk_size=ObjectStore.UPLOAD_CHUNK_SIZE
     )
-    await object_store.create_object(thumbnail_object_id, data=thumbnail)
+    await object_store.create_object(
+        thumbnail_object_id, data=thumbnail, skip_bucket_check=True
+    )
 
     return CreateResponse(video_id=object_id)
 
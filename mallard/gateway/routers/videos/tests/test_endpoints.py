@@ -31,7 +31,7 @@ class CreateUavParams:
     Attributes:
         mock_file: The mocked `UploadFile` to use.
         mock_metadata: The mocked `UavVideoMetadata` structure.
-        mock_uuid: The mocked `uuid.uuid4` function.
+        mock_token_hex: The mocked `secrets.token_hex` function.
         mock_background_tasks: The mocked `BackgroundTasks` object to use.
         bucket_id: The ID of the bucket to use for testing.
 
@@ -41,7 +41,7 @@ class CreateUavParams:
 
     mock_file: UploadFile
     mock_metadata: UavVideoMetadata
-    mock_uuid: mock.Mock
+    mock_token_hex: mock.Mock
     mock_background_tasks: BackgroundTasks
     bucket_id: str
 
@@ -90,9 +90,9 @@ def create_uav_params(
         BackgroundTasks, instance=True
     )
 
-    # Make the UUID deterministic.
-    mock_uuid = mocker.patch("uuid.uuid4")
-    mock_uuid.return_value.hex = faker.uuid4()
+    # Make the unique name deterministic.
+    mock_token_hex = mocker.patch("secrets.token_hex")
+    mock_token_hex.return_value = faker.hexify("^" * 32)
 
     # Create a fake bucket.
     bucket = faker.pystr()
@@ -102,7 +102,7 @@ def create_uav_params(
     return CreateUavParams(
         mock_file=mock_file,
         mock_metadata=mock_metadata,
-        mock_uuid=mock_uuid,
+        mock_token_hex=mock_token_hex,
         mock_background_tasks=mock_background_tasks,
         bucket_id=bucket,
         mock_fill_metadata=mock_fill_metadata,
@@ -181,13 +181,15 @@ async def test_create_uav_video(
     got_video_id = response.video_id
     assert got_video_id.bucket == create_uav_params.bucket_id
     assert got_video_id.name.endswith(
-        create_uav_params.mock_uuid.return_value.hex
+        create_uav_params.mock_token_hex.return_value
     )
 
     # It should have updated the databases.
     assert config.mock_object_store.create_object.call_count == 4
     config.mock_object_store.create_object.assert_any_call(
-        got_video_id, data=create_uav_params.mock_file
+        got_video_id,
+        data=create_uav_params.mock_file,
+        skip_bucket_check=True,
     )
     config.mock_metadata_store.add.assert_called_once_with(
         object_id=got_video_id, metadata=create_uav_params.mock_metadata
@@ -210,6 +212,7 @@ async def test_create_uav_video(
             bucket=got_video_id.bucket, name=f"{got_video_id.name}.thumbnail"
         ),
         data=mock_thumbnail,
+        skip_bucket_check=True,
     )
 
     # It should have created the preview.
@@ -222,6 +225,7 @@ async def test_create_uav_video(
             bucket=got_video_id.bucket, name=f"{got_video_id.name}.preview"
         ),
         data=mock_preview,
+        skip_bucket_check=True,
     )
 
     # It should have created the streaming version.
@@ -234,6 +238,7 @@ async def test_create_uav_video(
             bucket=got_video_id.bucket, name=f"{got_video_id.name}.streamable"
         ),
         data=mock_preview,
+        skip_bucket_check=True,
     )
 
 
@@ -217,6 +217,35 @@ class TestFFProbeReader:
         # Act and assert.
         assert config.reader.num_frames == int(config.reader.frame_rate)
 
+    @pytest.mark.parametrize("nb_frames", ["N/A", None])
+    def test_num_frames_from_duration(
+        self, config: ConfigForTests, faker: Faker, nb_frames: str | None
+    ) -> None:
+        """
+        Tests that it derives the number of frames from the duration if the
+        frame count is not available.
+
+        Args:
+            config: The configuration to use for testing.
+            faker: The fixture to use for generating fake data.
+            nb_frames: The invalid frame count to report.
+
+        """
+        # Arrange.
+        video_stream = config.ffprobe_results["streams"][1]
+        if nb_frames is None:
+            del video_stream["nb_frames"]
+        else:
+            video_stream["nb_frames"] = nb_frames
+
+        duration = faker.pyfloat(min_value=1, max_value=1000)
+        config.ffprobe_results["format"]["duration"] = f"{duration:.6f}"
+
+        # Act and assert.
+        assert config.reader.num_frames == int(
+            float(f"{duration:.6f}") * config.reader.frame_rate
+        )
+
 
 @dataclass(frozen=True, config=ArbitraryTypesConfig)
 class FillMetadataConfig:
@@ -308,6 +337,13 @@ async def test_fill_metadata(
     if use_saved_video:
         # Simulate saved video data.
         saved_video = faker.object_ref()
+    else:
+        # Make it look like probing consumed the uploaded file.
+        def _probe_upload(video: UploadFile) -> Dict[str, Any]:
+            video.file.read()
+            return fill_meta_config.probe_results
+
+        fill_meta_config.mock_probe_video.side_effect = _probe_upload
 
     # Act.
     got_metadata = await video_metadata.fill_metadata(
@@ -324,8 +360,12 @@ async def test_fill_metadata(
         else saved_video
     )
 
-    # It should have reset the position in the video file after reading.
-    fill_meta_config.mock_upload_file.seek.assert_called_once_with(0)
+    if use_saved_video:
+        # It never read the uploaded file, so it shouldn't need to reset it.
+        fill_meta_config.mock_upload_file.seek.assert_not_called()
+    else:
+        # It should have reset the position in the video file after reading.
+        fill_meta_config.mock_upload_file.seek.assert_called_once_with(0)
 
     # None of the values populated from FFProbe results or file metadata should
     # have been left unfilled.
@@ -8,6 +8,7 @@ from functools import singledispatch, wraps
 from typing import Any, AsyncIterable, Callable, Dict
 
 import aiohttp
+import orjson
 from aiohttp.client_exceptions import ClientPayloadError
 from fastapi import HTTPException, UploadFile
 from loguru import logger
@@ -199,7 +200,7 @@ async def _probe_video(video: UploadFile) -> Dict[str, Any]:
                 detail=f"Metadata inference failed: {response.reason}",
             )
 
-        return await response.json()
+        return await response.json(loads=orjson.loads)
 
 
 @_probe_video.register
@@ -225,7 +226,7 @@ async def _(video: ObjectRef) -> Dict[str, Any]:
                 detail=f"Metadata inference failed: {response.reason}",
             )
 
-        return await response.json()
+        return await response.json(loads=orjson.loads)
 
 
 @client_retry
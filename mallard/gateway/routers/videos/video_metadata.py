@@ -112,7 +112,14 @@ class FFProbeReader:
         """
         try:
             return int(self.__video_stream["nb_frames"])
-        except KeyError:
+        except (KeyError, TypeError, ValueError):
+            # Some containers don't record the frame count, in which case
+            # FFmpeg either omits it or reports it as "N/A".
+            pass
+
+        try:
+            return int(float(self.__format["duration"]) * self.frame_rate)
+        except (KeyError, TypeError, ValueError):
             # FFmpeg doesn't always seem to get the number of frames from
             # really short videos (e.g. 1-second videos).
             logger.warning("No length from FFMpeg, assuming 1 second.")
@@ -153,8 +160,10 @@ async def fill_metadata(
         # things don't *completely* break.
         logger.exception("Video probe failed. Using default metadata.")
 
-    # Reset the video file after probing.
-    await video.seek(0)
+    # Reset the video file after probing. If we probed a saved copy, the
+    # upload was never read, and we can skip this.
+    if video.file.tell() != 0:
+        await video.seek(0)
 
     if probe_results is not None:
         reader = FFProbeReader(probe_results)
@@ -4,6 +4,7 @@ Tests for the `async_utils` module.
 
 
 import enum
+import random
 import time
 from typing import Iterable
 
@@ -51,6 +52,24 @@ class ConditionForTest(enum.IntEnum):
     """
 
 
+_ITER_TEST_ITEMS = tuple(range(10))
+"""
+Items to produce from the iterable in `make_async_iter` tests.
+"""
+_ITER_DELAYS = {
+    # Delays are all zero.
+    ConditionForTest.NO_DELAY: (0.0,) * 10,
+    # Delays are constant.
+    ConditionForTest.CONSTANT_DELAY: (0.001,) * 10,
+    # Delays are arbitrary.
+    ConditionForTest.RANDOM_DELAY: (0.001, 0.01, 0.005, 0.0, 0.015) * 2,
+}
+"""
+Delays to use between items for each test condition. These only need to be
+long enough that the consumer sometimes has to wait on the producer thread.
+"""
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "condition", ConditionForTest, ids=[m.name for m in ConditionForTest]
@@ -64,21 +83,11 @@ async def test_make_async_iter(condition: ConditionForTest) -> None:
 
     """
     # Arrange.
-    test_items = list(range(10))
-
-    if condition == ConditionForTest.NO_DELAY:
-        # Delays are all zero.
-        delays = [0] * 10
-    if condition == ConditionForTest.CONSTANT_DELAY:
-        # Delays are constant.
-        delays = [0.01] * 10
-    if condition == ConditionForTest.RANDOM_DELAY:
-        # Delays are arbitrary.
-        delays = [0.01, 0.1, 0.05, 0.0, 0.15] * 2
+    delays = _ITER_DELAYS[condition]
 
     # Create the fake synchronous iterable.
     def sync_iter() -> Iterable[int]:
-        for item, delay in zip(test_items, delays):
+        for item, delay in zip(_ITER_TEST_ITEMS, delays):
             time.sleep(delay)
             yield item
 
@@ -87,7 +96,7 @@ async def test_make_async_iter(condition: ConditionForTest) -> None:
 
     # Assert.
     # It should have gotten the correct items.
-    assert got_items == test_items
+    assert got_items == list(_ITER_TEST_ITEMS)
 
 
 @pytest.mark.asyncio
@@ -114,7 +123,7 @@ async def test_make_async_iter_exception() -> None:
     # Arrange.
     # This will raise an exception when iterated.
     def failing_iterable() -> Iterable[int]:
-        yield from [0, 1, 2]
+        yield from range(3)
         raise ValueError("Hark! An Error!")
 
     # Act and assert.
@@ -123,19 +132,36 @@ async def test_make_async_iter_exception() -> None:
             pass
 
 
+@pytest.fixture(scope="module")
+def file_contents() -> bytes:
+    """
+    Generates the file contents to use for `read_file_chunks` tests. This is
+    module-scoped so that all the parametrizations can share it.
+
+    Returns:
+        The fake file contents.
+
+    """
+    return random.Random(1337).randbytes(1024)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("max_length", [None, 512], ids=["no_limit", "limit"])
-async def test_read_file_chunks(faker: Faker, max_length: int | None) -> None:
+async def test_read_file_chunks(
+    faker: Faker, file_contents: bytes, max_length: int | None
+) -> None:
     """
     Tests that `read_file` works.
 
     Args:
         faker: The fixture to use for generating fake data.
+        file_contents: The contents of the file to read.
         max_length: The maximum length of the data to read from the file.
 
     """
     # Arrange.
-    contents = faker.binary(length=1024)
+    contents = file_contents
+    # Each test gets its own file so that read position is not shared.
     upload_file = faker.upload_file(contents=contents)
 
     # Act.
@@ -3,12 +3,15 @@ Schema definitions common to all locations.
 """
 
 
-from typing import Any
+from functools import cache
+from typing import Any, Callable
 
+import orjson
 from pydantic import BaseModel
 from pydantic.generics import GenericModel
 
 
+@cache
 def _snake_to_camel_case(snake: str) -> str:
     """
     Converts a field name in snake case, i.e. `my_field`, to one in camel
@@ -27,6 +30,22 @@ def _snake_to_camel_case(snake: str) -> str:
     return f"{first_word}{other_words}"
 
 
+def _orjson_dumps(value: Any, *, default: Callable[[Any], Any]) -> str:
+    """
+    Serializes a value to JSON using `orjson`, which is considerably faster
+    than the standard library.
+
+    Args:
+        value: The value to serialize.
+        default: Fallback function for serializing unsupported types.
+
+    Returns:
+        The serialized JSON.
+
+    """
+    return orjson.dumps(value, default=default).decode()
+
+
 class _ApiModelConfig:
     """
     Default config class for ApiModels.
@@ -36,6 +55,9 @@ class _ApiModelConfig:
     allow_population_by_field_name = True
     allow_mutation = False
 
+    json_loads = orjson.loads
+    json_dumps = _orjson_dumps
+
 
 class ApiModel(BaseModel):
     """
@@ -20,8 +20,24 @@ class ConcurrencyLimitedRunner:
         Args:
             max_processes: The maximum number of processes to run at once.
         """
-        self.__semaphore = asyncio.Semaphore(max_processes)
-        self.__running_processes = set()
+        self.__semaphore = asyncio.BoundedSemaphore(max_processes)
+        # Tasks that wait for running processes. We need to keep references
+        # to these so that they don't get garbage-collected early.
+        self.__wait_tasks = set()
+
+    def __finalize_wait_task(self, task: asyncio.Task) -> None:
+        """
+        Cleans up after a task that waits for a process.
+
+        Args:
+            task: The task that finished.
+
+        """
+        self.__wait_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.opt(exception=task.exception()).error(
+                "Failed to wait for process:"
+            )
 
     async def run(self, *args, **kwargs) -> asyncio.subprocess.Process:
         """
@@ -40,10 +56,12 @@ class ConcurrencyLimitedRunner:
         async def _wait_for_process(
             process_: asyncio.subprocess.Process,
         ) -> None:
-            await process_.wait()
-            # Release the semaphore.
-            logger.debug("Process finished, releasing semaphore.")
-            self.__semaphore.release()
+            try:
+                await process_.wait()
+            finally:
+                # Release the semaphore.
+                logger.debug("Process finished, releasing semaphore.")
+                self.__semaphore.release()
 
         # Acquire the semaphore before starting.
         logger.debug("Acquiring semaphore to start subprocess...")
@@ -53,9 +71,11 @@ class ConcurrencyLimitedRunner:
             # Start the process.
             process = await asyncio.create_subprocess_exec(*args, **kwargs)
             # Wait for it to finish and then release the semaphore.
-            asyncio.create_task(
+            wait_task = asyncio.create_task(
                 _wait_for_process(process), name="wait_for_process"
             )
+            self.__wait_tasks.add(wait_task)
+            wait_task.add_done_callback(self.__finalize_wait_task)
         except Exception as err:
             # Release the lock if something fails prematurely.
             logger.debug("Process failed to start, releasing semaphore.")
@@ -7,11 +7,12 @@ to the disk.
 """
 
 import asyncio
-import json
+import fcntl
 import tempfile
 from pathlib import Path
-from typing import Any, AsyncIterable, Coroutine, Dict, Tuple
+from typing import Any, AsyncIterable, Coroutine, Dict, Iterable, Tuple
 
+import orjson
 from loguru import logger
 
 from ..cli_utils import find_exe
@@ -30,11 +31,56 @@ FFPROBE_ARGS = [
 """
 Arguments to use for ffprobe.
 """
+_INPUT_ARGS = ("-i", "pipe:")
+"""
+Arguments that make ffmpeg read its input from stdin.
+"""
+_PREVIEW_OUTPUT_ARGS = ("-c:v", "vp9", "-row-mt", "1", "-f", "webm", "-")
+"""
+Arguments that follow the video filter when creating a preview.
+"""
+_STREAMABLE_OUTPUT_ARGS = (
+    "-c:v",
+    "vp9",
+    "-row-mt",
+    "1",
+    "-b:v",
+    "1800k",
+    "-maxrate",
+    "2610k",
+    "-crf",
+    "10",
+    "-f",
+    "webm",
+    "-",
+)
+"""
+Arguments that follow the video filter when creating a streamable video.
+"""
+_THUMBNAIL_OUTPUT_ARGS = ("-vframes", "1", "-f", "singlejpeg", "-")
+"""
+Arguments that follow the video filter when creating a thumbnail.
+"""
 
 _INPUT_CHUNK_SIZE = 10 * 2**20
 """
 Size of the chunks to use when feeding input to subprocesses.
 """
+_STDIN_HIGH_WATER = 2 * 2**20
+"""
+Size of the subprocess stdin write buffer above which we stop feeding input
+until it drains.
+"""
+_STDIN_LOW_WATER = 256 * 2**10
+"""
+Size of the subprocess stdin write buffer below which we resume feeding input.
+This is kept well above zero so that the next input chunk can be fetched while
+the subprocess is still busy with the previous one.
+"""
+_STDIN_PIPE_SIZE = 2**20
+"""
+Kernel buffer size to request for the pipe that feeds input to subprocesses.
+"""
 _MAX_QUEUE_SIZE = 2**20
 """
 Maximum size of the queue to use when reading output data.
@@ -44,10 +90,17 @@ _FILE_CHUNK_SIZE = 10 * 2**20
 Size of chunks to read when reading from a file.
 """
 
+_OUTPUT_BUFFER_LIMIT = 2**20
+"""
+Buffer limit for the readers of subprocess stdout and stderr. Larger values
+let us read the output in fewer, bigger chunks.
+"""
+
 _DEFAULT_PIPES = dict(
     stdin=asyncio.subprocess.PIPE,
     stdout=asyncio.subprocess.PIPE,
     stderr=asyncio.subprocess.PIPE,
+    limit=_OUTPUT_BUFFER_LIMIT,
 )
 """
 Default configuration for stdin, stdout, and stderr for subprocesses.
@@ -65,6 +118,7 @@ async def _read_from_queue_until_finished(
     queue: asyncio.Queue,
     process_wait_task: asyncio.Task,
     ignore_errors: bool = False,
+    background_tasks: Iterable[asyncio.Task] = (),
 ) -> AsyncIterable[bytes]:
     """
     Reads output from a subprocess on a queue until the subprocess exits.
@@ -72,10 +126,13 @@ async def _read_from_queue_until_finished(
     Args:
         queue: The queue to read data from.
         process_wait_task: The task that completes once the process is finished.
-        ignore_errors: If tru, it will not raise an exception if the process
+        ignore_errors: If true, it will not raise an exception if the process
             exits with a non-zero code.
+        background_tasks: Background tasks for this process that we should
+            wait for once all the output has been read.
 
-    Returns:
+    Yields:
+        The chunks that it read from the queue.
 
     """
     # Iterates the messages it reads from the queue.
@@ -95,42 +152,32 @@ async def _read_from_queue_until_finished(
             f"Process exited with error code {process_wait_task.result()}."
         )
 
+    # Wait for background tasks to complete.
+    try:
+        await asyncio.gather(*background_tasks)
+    except BrokenPipeError:  # pragma: no coverage
+        # Ignore this, because it probably just means the process exited
+        # before it was finished writing.
+        pass
 
-async def _process_io(
-    process: asyncio.subprocess.Process,
-    *,
-    io: Coroutine,
-    ignore_exit: bool = False,
-) -> Any:
+
+def _enlarge_pipe(writer: asyncio.StreamWriter, size: int) -> None:
     """
-    Performs I/O on the streams from a process. At the same time, it checks
-    if the process has exited, and cancels the I/O operation automatically if
-    does.
+    Tries to enlarge the kernel buffer for a pipe. A larger buffer means that
+    the subprocess can consume more data per wakeup of the event loop.
 
     Args:
-        process: The process to check.
-        io: The coroutine that performs the I/O.
-        ignore_exit: If False, it will raise a `BrokenPipeError` if the process
-            exits during the operation.
-
-    Returns:
+        writer: The writer for the pipe.
+        size: The buffer size to request, in bytes.
 
     """
-    wait_task = asyncio.create_task(process.wait())
-    io_task = asyncio.create_task(io)
-
-    done, pending = await asyncio.wait(
-        [wait_task, io_task], return_when=asyncio.FIRST_COMPLETED
-    )
-    for task in pending:
-        # Cancel whatever didn't finish.
-        task.cancel()
-
-    if io_task in done:
-        return io_task.result()
-    if not ignore_exit:  # pragma: no coverage
-        # If the process exited, we should raise an exception.
-        raise BrokenPipeError("Process has exited already.")
+    pipe = writer.get_extra_info("pipe")
+    try:
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, size)
+    except (AttributeError, OSError) as error:  # pragma: no cover
+        # This is only supported on Linux, and can fail if the size is
+        # larger than the system allows.
+        logger.debug("Could not enlarge pipe buffer: {}", error)
 
 
 async def _streaming_communicate(
@@ -165,6 +212,11 @@ async def _streaming_communicate(
     def _finalize_background_task(
         task: asyncio.Task,
     ) -> None:  # pragma: no coverage
+        if task.cancelled():
+            # We cancel tasks on purpose once they are no longer needed, so
+            # there is nothing to report.
+            running_tasks.discard(task)
+            return
         if task.exception() and not isinstance(
             # This usually happens because the process exited before we
             # finished writing the input, and can be ignored.
@@ -180,89 +232,83 @@ async def _streaming_communicate(
             raise task.exception()
         running_tasks.discard(task)
 
-    def _submit_background_task(to_run: Coroutine) -> None:
+    def _submit_background_task(to_run: Coroutine) -> asyncio.Task:
         # This is necessary to stop tasks from getting garbage collected
         # before they're done.
         next_task = asyncio.create_task(to_run, name=to_run.__name__)
         running_tasks.add(next_task)
         # Remove it once it finishes.
         next_task.add_done_callback(_finalize_background_task)
+        return next_task
 
     async def _feed_input() -> None:
         # Feed data from the source to the process stdin.
-        async for chunk in input_source:
-            process.stdin.write(chunk)
-            try:
-                await _process_io(process, io=process.stdin.drain())
-            except (
-                BrokenPipeError,
-                ConnectionResetError,
-            ):  # pragma: no coverage
-                # The process probably exited, so we should terminate nicely.
-                await _process_io(
-                    process, io=process.stdin.wait_closed(), ignore_exit=True
-                )
-                return
-
-        # We have exhausted the input.
-        process.stdin.close()
-        await process.stdin.wait_closed()
+        try:
+            async for chunk in input_source:
+                process.stdin.write(chunk)
+                # If the process exits, the pipe closes and this raises, so
+                # there is no need to race it against the process exit.
+                await process.stdin.drain()
+
+            # We have exhausted the input.
+            process.stdin.close()
+            await process.stdin.wait_closed()
+        except (
+            BrokenPipeError,
+            ConnectionResetError,
+        ):  # pragma: no coverage
+            # The process probably exited, so we should terminate nicely.
+            # The pipe is already closed at this point, so there is nothing
+            # left to wait for.
+            return
+        except asyncio.CancelledError:  # pragma: no coverage
+            # We get cancelled when the process exits, in which case there
+            # is no point in waiting for more input.
+            return
 
     async def _stream_output(
         reader: asyncio.StreamReader,
         queue: asyncio.Queue,
     ) -> None:
-        # Read data from the process and write it to a queue.
-        chunk = await reader.read(_INPUT_CHUNK_SIZE)
-        await queue.put(chunk)
-        if len(chunk) == 0:
-            # We have exhausted the output stream. An empty chunk indicates
-            # to queue consumers that this is the case.
-            return
-
-        if process.returncode is None:
-            # If it's still running, repeat this step.
-            _submit_background_task(_stream_output(reader, queue))
-        elif len(chunk) > 0:
-            # Ensure that the reader task exits in this case.
-            await queue.put(b"")
-
-    async def _read_from_queue(
-        queue: asyncio.Queue,
-        wait_task_: asyncio.Task,
-        ignore_errors: bool = False,
-    ) -> AsyncIterable[bytes]:
-        async for chunk in _read_from_queue_until_finished(
-            queue, wait_task_, ignore_errors=ignore_errors
-        ):
-            yield chunk
-
-        # Wait for background tasks to complete.
-        try:
-            await asyncio.gather(*running_tasks)
-        except BrokenPipeError:  # pragma: no coverage
-            # Ignore this, because it probably just means the process exited
-            # before it was finished writing.
-            pass
-        except Exception as err:  # pragma: no coverage
-            # If we have other errors, we should raise them.
-            raise err
+        # Read data from the process and write it to a queue until we reach
+        # the end of the stream.
+        while True:
+            chunk = await reader.read(_INPUT_CHUNK_SIZE)
+            await queue.put(chunk)
+            if len(chunk) == 0:
+                # We have exhausted the output stream. An empty chunk
+                # indicates to queue consumers that this is the case.
+                return
 
     # We'll always be waiting for the process to exit.
     wait_task = asyncio.create_task(process.wait())
     if input_source is not None:
         # At the same time, feed the input to the process.
-        _submit_background_task(_feed_input())
+        process.stdin.transport.set_write_buffer_limits(
+            high=_STDIN_HIGH_WATER, low=_STDIN_LOW_WATER
+        )
+        _enlarge_pipe(process.stdin, _STDIN_PIPE_SIZE)
+        feed_task = _submit_background_task(_feed_input())
+        # Once the process exits, it can't read any more input, so stop
+        # waiting on the source for it.
+        wait_task.add_done_callback(lambda _: feed_task.cancel())
     # Also read the output from the process.
     _submit_background_task(_stream_output(process.stdout, stdout_queue))
     _submit_background_task(_stream_output(process.stderr, stderr_queue))
 
     # Read the data from the queues.
     return (
-        _read_from_queue(stdout_queue, wait_task),
+        _read_from_queue_until_finished(
+            stdout_queue, wait_task, background_tasks=running_tasks
+        ),
         # Ignore errors on stderr, because we still want to read this
         # output even if the command failed.
-        _read_from_queue(stderr_queue, wait_task, ignore_errors=True),
+        _read_from_queue_until_finished(
+            stderr_queue,
+            wait_task,
+            ignore_errors=True,
+            background_tasks=running_tasks,
+        ),
     )
 
 
@@ -282,13 +328,19 @@ async def ensure_streamable(
     """
 
     async def read_output_from_file(file_path: Path) -> AsyncIterable[bytes]:
-        file = file_path.open("rb")
-        while _chunk := file.read(_FILE_CHUNK_SIZE):
-            yield _chunk
-
-        # Delete the file when done.
-        logger.debug("Deleting temporary file {}", file_path)
-        file_path.unlink()
+        try:
+            with file_path.open("rb") as file:
+                # Read in a thread so we don't block the event loop on disk
+                # I/O.
+                while _chunk := await asyncio.to_thread(
+                    file.read, _FILE_CHUNK_SIZE
+                ):
+                    yield _chunk
+
+        finally:
+            # Delete the file when done.
+            logger.debug("Deleting temporary file {}", file_path)
+            file_path.unlink()
 
     logger.info("Fixing non-streamable video input...")
 
@@ -322,8 +374,11 @@ async def ensure_streamable(
         )
         stderr = b"".join([c async for c in stderr])
         logger.debug("ffmpeg stderr: {}", stderr)
-        stdout = "".join([c.decode("utf8") async for c in stdout])
-        logger.debug("ffmpeg stdout: {}", stdout)
+        stdout = b"".join([c async for c in stdout])
+        logger.opt(lazy=True).debug(
+            "ffmpeg stdout: {}",
+            lambda: stdout.decode("utf8", errors="replace"),
+        )
 
         async def _error_stream() -> AsyncIterable[bytes]:
             yield stderr
@@ -358,13 +413,16 @@ async def ffprobe(source: AsyncIterable[bytes]) -> Dict[str, Any]:
     )
 
     # There should be minimal output here, so we can just read it all at once.
-    stdout = "".join([c.decode("utf8") async for c in stdout])
-    stderr = "".join([c.decode("utf8") async for c in stderr])
-    logger.debug("ffprobe stderr: {}", stderr)
+    stdout = b"".join([c async for c in stdout])
+    stderr = b"".join([c async for c in stderr])
+    # Only decode the output if it's actually going to be logged.
+    logger.opt(lazy=True).debug(
+        "ffprobe stderr: {}", lambda: stderr.decode("utf8", errors="replace")
+    )
     await ffprobe_process.wait()
 
     # Otherwise, parse the output.
-    return json.loads(stdout)
+    return orjson.loads(stdout)
 
 
 async def create_preview(
@@ -385,17 +443,10 @@ async def create_preview(
     ffmpeg = find_exe("ffmpeg")
     ffmpeg_process = await _g_runner.run(
         ffmpeg,
-        "-i",
-        "pipe:",
+        *_INPUT_ARGS,
         "-vf",
         f"scale={preview_width}:-2,setsar=1:1,fps=30",
-        "-c:v",
-        "vp9",
-        "-row-mt",
-        "1",
-        "-f",
-        "webm",
-        "-",
+        *_PREVIEW_OUTPUT_ARGS,
         **_DEFAULT_PIPES,
     )
     return await _streaming_communicate(ffmpeg_process, input_source=source)
@@ -419,23 +470,10 @@ async def create_streamable(
     ffmpeg = find_exe("ffmpeg")
     ffmpeg_process = await _g_runner.run(
         ffmpeg,
-        "-i",
-        "pipe:",
+        *_INPUT_ARGS,
         "-vf",
         f"scale='min({max_width},iw)':-2,setsar=1:1,fps=30",
-        "-c:v",
-        "vp9",
-        "-row-mt",
-        "1",
-        "-b:v",
-        "1800k",
-        "-maxrate",
-        "2610k",
-        "-crf",
-        "10",
-        "-f",
-        "webm",
-        "-",
+        *_STREAMABLE_OUTPUT_ARGS,
         **_DEFAULT_PIPES,
     )
     return await _streaming_communicate(ffmpeg_process, input_source=source)
@@ -459,15 +497,10 @@ async def create_thumbnail(
     ffmpeg = find_exe("ffmpeg")
     ffmpeg_process = await asyncio.create_subprocess_exec(
         ffmpeg,
-        "-i",
-        "pipe:",
+        *_INPUT_ARGS,
         "-vf",
         f"scale={thumbnail_width}*sar:-2,setsar=1",
-        "-vframes",
-        "1",
-        "-f",
-        "singlejpeg",
-        "-",
+        *_THUMBNAIL_OUTPUT_ARGS,
         **_DEFAULT_PIPES,
     )
     return await _streaming_communicate(ffmpeg_process, input_source=source)
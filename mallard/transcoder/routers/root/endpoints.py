@@ -23,6 +23,44 @@ from ...ffmpeg import (
 
 router = APIRouter(tags=["transcoder"])
 
+STREAM_CHUNK_BYTES = 256 * 2**10
+"""
+Minimum size of the chunks that we send in streaming responses. Smaller chunks
+from ffmpeg get combined, so that we don't pay for a full ASGI send on each
+one.
+"""
+
+
+async def _coalesce_chunks(
+    stream: AsyncIterable[bytes], min_size: int = STREAM_CHUNK_BYTES
+) -> AsyncIterable[bytes]:
+    """
+    Combines small chunks from a stream into larger ones.
+
+    Args:
+        stream: The stream to read from.
+        min_size: The minimum size of the chunks to produce. (The last chunk
+            may be smaller.)
+
+    Yields:
+        The combined chunks.
+
+    """
+    buffer = bytearray()
+    async for chunk in stream:
+        if not buffer and len(chunk) >= min_size:
+            # This is already big enough, so we can avoid copying it.
+            yield chunk
+            continue
+
+        buffer += chunk
+        if len(buffer) >= min_size:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
+
 
 def _streaming_response_with_errors(
     data_stream: AsyncIterable[bytes],
@@ -48,12 +86,14 @@ def _streaming_response_with_errors(
     async def _read_and_handle_errors(stream: AsyncIterable[bytes]):
         num_bytes_read = 0
         try:
-            async for chunk in stream:
+            async for chunk in _coalesce_chunks(stream):
                 num_bytes_read += len(chunk)
                 yield chunk
-            logger.debug(
+            # Only decode the output if it's actually going to be logged.
+            stderr = b"".join([c async for c in error_stream])
+            logger.opt(lazy=True).debug(
                 "ffmpeg stderr: {}",
-                "".join([c.decode("utf8") async for c in error_stream]),
+                lambda: stderr.decode("utf8", errors="replace"),
             )
 
         except OSError:
@@ -62,7 +102,9 @@ def _streaming_response_with_errors(
             )
             logger.error(
                 "ffmpeg stderr: {}",
-                "".join([c.decode("utf8") async for c in error_stream]),
+                b"".join([c async for c in error_stream]).decode(
+                    "utf8", errors="replace"
+                ),
             )
             raise HTTPException(
                 status_code=422,
@@ -105,7 +147,10 @@ async def ensure_faststart(
         "Replacing video {} with version that supports faststart.", video_ref
     )
     await object_store.delete_object(video_ref)
-    await object_store.create_object(video_ref, data=converted_video)
+    # We just read the video from this bucket, so it must exist.
+    await object_store.create_object(
+        video_ref, data=converted_video, skip_bucket_check=True
+    )
 
 
 async def _infer_video_metadata(video: AsyncIterable[bytes]) -> Dict[str, Any]:
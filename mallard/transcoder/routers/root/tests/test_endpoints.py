@@ -333,7 +333,9 @@ async def test_ensure_faststart(
     # It should have written it back to the object store.
     config.mock_object_store.delete_object.assert_called_once_with(fake_video)
     config.mock_object_store.create_object.assert_called_once_with(
-        fake_video, data=config.mock_ensure_streamable.return_value[0]
+        fake_video,
+        data=config.mock_ensure_streamable.return_value[0],
+        skip_bucket_check=True,
     )
 
 
@@ -388,7 +390,7 @@ async def test_create_video_preview(
     preview_data_iter = config.mock_streaming_response_class.call_args.args[0]
     preview_data = [c async for c in preview_data_iter]
     reference_data = [c async for c in reference_bytes]
-    assert preview_data == reference_data
+    assert b"".join(preview_data) == b"".join(reference_data)
 
     assert result == config.mock_streaming_response_class.return_value
 
@@ -482,7 +484,7 @@ async def test_create_streaming_video(
     stream_data_iter = config.mock_streaming_response_class.call_args.args[0]
     video_data = [c async for c in stream_data_iter]
     reference_data = [c async for c in reference_bytes]
-    assert video_data == reference_data
+    assert b"".join(video_data) == b"".join(reference_data)
 
     assert result == config.mock_streaming_response_class.return_value
 
@@ -579,7 +581,7 @@ async def test_create_video_thumbnail(
     ]
     thumbnail_data = [c async for c in thumbnail_data_iter]
     reference_data = [c async for c in reference_bytes]
-    assert thumbnail_data == reference_data
+    assert b"".join(thumbnail_data) == b"".join(reference_data)
 
     assert result == config.mock_streaming_response_class.return_value
 
@@ -620,3 +622,49 @@ async def test_create_video_thumbnail_invalid(
             pass
 
         assert exc_info.value.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_coalesces_chunks(
+    config: ConfigForTests, faker: Faker, empty_iter: AsyncIterable[bytes]
+) -> None:
+    """
+    Tests that the streaming responses combine small chunks from ffmpeg into
+    larger ones.
+
+    Args:
+        config: The configuration to use for testing.
+        faker: The fixture to use for generating fake data.
+        empty_iter: Iterable returning an empty bytes object.
+
+    """
+    # Arrange.
+    # Produce enough small chunks to fill a bit more than two output chunks.
+    chunk_size = 1024
+    num_chunks = 2 * endpoints.STREAM_CHUNK_BYTES // chunk_size + 1
+    chunks = [faker.random.randbytes(chunk_size) for _ in range(num_chunks)]
+
+    async def _iter():
+        for chunk in chunks:
+            yield chunk
+
+    config.mock_create_preview.return_value = (_iter(), empty_iter)
+    fake_video = faker.object_ref()
+
+    # Act.
+    await endpoints.create_video_preview(
+        fake_video.bucket,
+        fake_video.name,
+        object_store=config.mock_object_store,
+    )
+    data_stream = config.mock_streaming_response_class.call_args.args[0]
+    sent_chunks = [c async for c in data_stream]
+
+    # Assert.
+    # It should have sent two full chunks, plus the remainder.
+    assert [len(c) for c in sent_chunks] == [
+        endpoints.STREAM_CHUNK_BYTES,
+        endpoints.STREAM_CHUNK_BYTES,
+        chunk_size,
+    ]
+    assert b"".join(sent_chunks) == b"".join(chunks)
@@ -38,11 +38,18 @@ class TestConcurrencyLimitedRunner:
         A fake process class that's instrumented for testing.
         """
 
-        def __init__(self):
+        def __init__(self, wait_error: Exception | None = None):
+            """
+            Args:
+                wait_error: If specified, `wait()` will raise this error once
+                    the process finishes.
+
+            """
             # Internal event object to manage waiting.
             self.__event = asyncio.Event()
             # Flag that keeps track of whether the process is finished.
             self.__is_running = True
+            self.__wait_error = wait_error
 
         async def wait(self) -> int:
             """
@@ -54,6 +61,8 @@ class TestConcurrencyLimitedRunner:
 
             """
             await self.__event.wait()
+            if self.__wait_error is not None:
+                raise self.__wait_error
             return 0
 
         def finish(self) -> None:
@@ -194,3 +203,37 @@ class TestConcurrencyLimitedRunner:
 
         # It should have completed.
         assert not process.running
+
+    @pytest.mark.asyncio
+    async def test_wait_fails(
+        self, config: ConfigForTests, faker: Faker
+    ) -> None:
+        """
+        Tests that it releases the slot for a process even if waiting for
+        that process fails.
+
+        Args:
+            config: The configuration to use for testing.
+            faker: The fixture to use for generating fake data.
+
+        """
+        # Arrange.
+        # Make it look like waiting for the first process fails.
+        process1 = self.FakeProcess(wait_error=RuntimeError())
+        process2 = self.FakeProcess()
+        config.mock_create_subprocess_exec.side_effect = [process1, process2]
+
+        # Act.
+        await config.runner.run(faker.word())
+        process2_task = asyncio.create_task(
+            config.runner.run(faker.word()), name="process2"
+        )
+        process1.finish()
+
+        # Assert.
+        # The second process should still be able to start.
+        got_process2 = await asyncio.wait_for(process2_task, timeout=5)
+        assert got_process2 == process2
+
+        # Finish the process.
+        process2.finish()